@@ -1,9 +1,11 @@
 """Configuration parsing from /etc/default/ll-uni-fan-linux and CLI arguments."""
 
 import argparse
+import functools
 import logging
 import os
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 
 from dotenv import dotenv_values
 
@@ -13,17 +15,82 @@ DEFAULT_CONFIG_PATH = "/etc/default/ll-uni-fan-linux"
 VALID_PROFILES = ("silent", "balanced", "performance")
 ALL_CHANNELS = (0, 1, 2, 3)
 
+# Frozen sets for O(1) membership tests; the tuples above keep their ordering
+# for argparse choices and error messages
+_VALID_PROFILES_SET = frozenset(VALID_PROFILES)
+_VALID_CHANNELS = frozenset(ALL_CHANNELS)
+
+# Accepted log levels mapped to their numeric values; resolved once at
+# Config construction instead of getattr(logging, ...) per setup call
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+# Environment variables recognized by Config.load
+_ENV_KEYS = ("PROFILE", "POLL_INTERVAL", "LOG_LEVEL", "DEBUG", "CHANNELS", "SAFE_SPEED",
+             "PROTOCOL")
+
+
+@functools.lru_cache(maxsize=4)
+def _parsed_dotenv(path: str, mtime: float) -> dict[str, str]:
+    """Parse an environment file, cached on (path, mtime).
+
+    SIGHUP reloads hit this repeatedly with an unchanged file; keying the
+    cache on the mtime means the file is only re-read when it actually
+    changed.
+    """
+    return {k: v for k, v in dotenv_values(path).items() if v is not None}
+
 
 def _parse_channels(raw: str) -> tuple[int, ...]:
     """Parse a comma-separated list of channel numbers (0-3)."""
-    channels = tuple(sorted(set(int(c.strip()) for c in raw.split(","))))
-    if not channels or any(c < 0 or c > 3 for c in channels):
+    if not raw.strip():
+        raise ValueError("Invalid channels: empty value. Must be comma-separated values in 0-3")
+    try:
+        channels = {int(c) for c in raw.split(",")}
+    except ValueError as e:
+        raise ValueError(
+            f"Invalid channels: {raw}. Must be comma-separated values in 0-3"
+        ) from e
+    if not channels <= _VALID_CHANNELS:
         raise ValueError(f"Invalid channels: {raw}. Must be comma-separated values in 0-3")
-    return channels
-
-
-def _parse_cli_args(argv: list[str] | None = None) -> argparse.Namespace:
-    """Parse command-line arguments."""
+    return tuple(sorted(channels))
+
+
+def _parse_bool(raw: str) -> bool:
+    """Parse a boolean environment value ("true", "1", "yes")."""
+    return raw.lower() in ("true", "1", "yes")
+
+
+# (environment key, Config field, converter) driving the env override stage
+_ENV_SPECS: tuple[tuple[str, str, Callable[[str], object]], ...] = (
+    ("PROFILE", "profile", str.lower),
+    ("POLL_INTERVAL", "poll_interval", float),
+    ("LOG_LEVEL", "log_level", str.upper),
+    ("DEBUG", "debug", _parse_bool),
+    ("CHANNELS", "channels", _parse_channels),
+    ("SAFE_SPEED", "safe_speed", float),
+    ("PROTOCOL", "protocol", str.lower),
+)
+
+# (argparse dest, Config field, converter) driving the CLI override stage;
+# argparse has already typed most values, so only strings need converting
+_CLI_SPECS: tuple[tuple[str, str, Callable[[str], object] | None], ...] = (
+    ("profile", "profile", None),
+    ("poll_interval", "poll_interval", None),
+    ("log_level", "log_level", None),
+    ("debug", "debug", None),
+    ("channels", "channels", _parse_channels),
+    ("safe_speed", "safe_speed", None),
+    ("protocol", "protocol", str.lower),
+)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         prog="ll-uni-fan-linux",
         description="Lian-Li UNI FAN SL-INF 120 Linux controller",
@@ -62,10 +129,20 @@ def _parse_cli_args(argv: list[str] | None = None) -> argparse.Namespace:
         "--protocol",
         help="Fan controller protocol key (see protocols.yaml)",
     )
-    return parser.parse_args(argv)
+    return parser
+
+
+# Built once at import time; parse_args() itself is stateless for our
+# arguments, so reloads don't pay the parser construction cost again.
+_PARSER = _build_parser()
+
 
+def _parse_cli_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    return _PARSER.parse_args(argv)
 
-@dataclass
+
+@dataclass(slots=True)
 class Config:
     """Daemon configuration."""
 
@@ -77,8 +154,10 @@ class Config:
     safe_speed: float = 90.0
     protocol: str = DEFAULT_PROTOCOL_KEY
 
+    _level_int: int = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
-        if self.profile not in VALID_PROFILES:
+        if self.profile not in _VALID_PROFILES_SET:
             raise ValueError(
                 f"Invalid profile '{self.profile}'. Must be one of: {', '.join(VALID_PROFILES)}"
             )
@@ -99,6 +178,14 @@ class Config:
         if self.debug:
             self.log_level = "DEBUG"
 
+        level = _LOG_LEVELS.get(self.log_level)
+        if level is None:
+            raise ValueError(
+                f"Invalid log level '{self.log_level}'. "
+                f"Must be one of: {', '.join(_LOG_LEVELS)}"
+            )
+        self._level_int = level
+
     @classmethod
     def load(cls, argv: list[str] | None = None) -> "Config":
         """Load configuration from environment file, env vars, and CLI args.
@@ -109,75 +196,41 @@ class Config:
         3. /etc/default/ll-uni-fan-linux file
         4. Dataclass defaults
         """
-        file_env = {k: v for k, v in dotenv_values(DEFAULT_CONFIG_PATH).items() if v is not None}
-
-        def env(key: str) -> str | None:
-            if key in os.environ:
-                return os.environ[key]
-            return file_env.get(key)
+        try:
+            mtime = os.stat(DEFAULT_CONFIG_PATH).st_mtime
+            file_env = _parsed_dotenv(DEFAULT_CONFIG_PATH, mtime)
+        except OSError:
+            file_env = {}
+
+        # Merge once: environment variables override file values, including
+        # empty strings set explicitly in the environment.
+        merged = dict(file_env)
+        for key in _ENV_KEYS:
+            if (v := os.environ.get(key)) is not None:
+                merged[key] = v
 
         kwargs: dict[str, object] = {}
 
-        if (v := env("PROFILE")) is not None:
-            kwargs["profile"] = v.lower()
-
-        if (v := env("POLL_INTERVAL")) is not None:
-            try:
-                kwargs["poll_interval"] = float(v)
-            except ValueError:
-                pass
-
-        if (v := env("LOG_LEVEL")) is not None:
-            kwargs["log_level"] = v.upper()
-
-        if (v := env("DEBUG")) is not None:
-            kwargs["debug"] = v.lower() in ("true", "1", "yes")
-
-        if (v := env("CHANNELS")) is not None:
-            try:
-                kwargs["channels"] = _parse_channels(v)
-            except ValueError:
-                pass
-
-        if (v := env("SAFE_SPEED")) is not None:
-            try:
-                kwargs["safe_speed"] = float(v)
-            except ValueError:
-                pass
+        # Malformed environment values are ignored and fall back to defaults
+        for env_key, field_name, convert in _ENV_SPECS:
+            if (v := merged.get(env_key)) is not None:
+                try:
+                    kwargs[field_name] = convert(v)
+                except ValueError:
+                    pass
 
-        if (v := env("PROTOCOL")) is not None:
-            kwargs["protocol"] = v.lower()
-
-        # CLI arguments override everything
+        # CLI arguments override everything; here bad values do raise
         args = _parse_cli_args(argv)
-
-        if args.profile is not None:
-            kwargs["profile"] = args.profile
-
-        if args.poll_interval is not None:
-            kwargs["poll_interval"] = args.poll_interval
-
-        if args.log_level is not None:
-            kwargs["log_level"] = args.log_level
-
-        if args.debug is True:
-            kwargs["debug"] = True
-
-        if args.channels is not None:
-            kwargs["channels"] = _parse_channels(args.channels)
-
-        if args.safe_speed is not None:
-            kwargs["safe_speed"] = args.safe_speed
-
-        if args.protocol is not None:
-            kwargs["protocol"] = args.protocol.lower()
+        for dest, field_name, cli_convert in _CLI_SPECS:
+            if (v := getattr(args, dest)) is not None:
+                kwargs[field_name] = cli_convert(v) if cli_convert is not None else v
 
         return cls(**kwargs)
 
     def setup_logging(self) -> None:
         """Configure logging based on this config."""
         logging.basicConfig(
-            level=getattr(logging, self.log_level),
+            level=self._level_int,
             format="[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
@@ -2,6 +2,7 @@
 
 import logging
 import time
+from collections.abc import Callable
 
 import hidraw as hid
 
@@ -21,6 +22,13 @@ class Controller:
         self._device: hid.device | None = None
         self._device_path: bytes | None = None
         self._initialized: bool = False
+        # Monotonic time before which the next command must not be sent.
+        # Pacing is paid lazily before the following write, so there is no
+        # trailing sleep after the last frame of a batch.
+        self._next_write_deadline: float = 0.0
+        # Init + mode frame sequences cached per channel set, so reconnects
+        # replay a prebuilt tuple instead of reassembling the frames
+        self._init_frames: dict[tuple[int, ...], tuple[bytes, ...]] = {}
 
     @property
     def connected(self) -> bool:
@@ -39,6 +47,7 @@ class Controller:
                 self._device = dev
                 self._device_path = path
                 self._initialized = False
+                self._next_write_deadline = 0.0
                 log.info(
                     "Connected to %s at %s (S/N: %s)",
                     self._protocol.name,
@@ -63,11 +72,21 @@ class Controller:
             self._initialized = False
             log.info("Controller connection closed")
 
-    def _write(self, data: list[int]) -> None:
-        """Write data to the HID device. Raises OSError on failure."""
-        if self._device is None:
-            raise OSError("Controller not connected")
-        self._device.write(bytes(data))
+    def _paced_write(
+        self, write: Callable[[bytes | bytearray], object], frame: bytes | bytearray, delay: float,
+    ) -> None:
+        """Write a frame no earlier than the pacing deadline, then push it out.
+
+        The protocol delays define minimum spacing between commands. Sleeping
+        the remaining slack just before the next write — rather than the full
+        delay after each one — lets write latency overlap the delay window
+        and drops the pointless sleep after the final frame of a batch.
+        """
+        slack = self._next_write_deadline - time.monotonic()
+        if slack > 0:
+            time.sleep(slack)
+        write(frame)
+        self._next_write_deadline = time.monotonic() + delay
 
     def initialize(self, channels: tuple[int, ...]) -> None:
         """Send init + manual mode commands. Called once after connection.
@@ -80,12 +99,19 @@ class Controller:
         p = self._protocol
         log.debug("Initializing %s for channels %s", p.name, channels)
 
-        self._write(p.build_init())
-        time.sleep(p.delay_init)
+        frames = self._init_frames.get(channels)
+        if frames is None:
+            frames = (p.build_init(), *(p.build_mode(ch) for ch in channels))
+            self._init_frames[channels] = frames
+
+        # Connection is validated above; bind the device write once instead
+        # of re-checking per frame. Each frame stays its own HID output
+        # report; they cannot be coalesced into a single write.
+        write = self._device.write
 
-        for ch in channels:
-            self._write(p.build_mode(ch))
-            time.sleep(p.delay_mode)
+        self._paced_write(write, frames[0], p.delay_init)
+        for frame in frames[1:]:
+            self._paced_write(write, frame, p.delay_mode)
 
         self._initialized = True
         log.info("Controller initialized (channels %s, manual mode)", channels)
@@ -102,11 +128,15 @@ class Controller:
             raise OSError("Controller not initialized")
 
         p = self._protocol
-        log.debug(
-            "Setting fan speed: %.1f%% (byte value: %d)",
-            speed_percent, p.speed_to_byte(speed_percent),
-        )
-
-        for ch in channels:
-            self._write(p.build_speed(ch, speed_percent))
-            time.sleep(p.delay_speed)
+        # The byte value is channel-independent: convert once, reuse per channel
+        byte = p.speed_to_byte(speed_percent)
+        log.debug("Setting fan speed: %.1f%% (byte value: %d)", speed_percent, byte)
+
+        # Each command must stay its own HID output report, so the frames
+        # cannot be joined into one write; prepare them all up front instead
+        # so the paced loop does nothing but write and sleep.
+        frames = [p.build_speed_byte(ch, byte) for ch in channels]
+
+        write = self._device.write
+        for frame in frames:
+            self._paced_write(write, frame, p.delay_speed)
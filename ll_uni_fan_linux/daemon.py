@@ -3,7 +3,7 @@
 import logging
 import signal
 import sys
-import time
+import threading
 
 from ll_uni_fan_linux.config import Config
 from ll_uni_fan_linux.controller import Controller
@@ -13,7 +13,16 @@ from ll_uni_fan_linux.temperature import read_cpu_temperature
 
 log = logging.getLogger(__name__)
 
-USB_RECONNECT_INTERVAL = 10.0  # seconds between reconnection attempts
+USB_RECONNECT_INTERVAL = 10.0  # initial delay between reconnection attempts (seconds)
+USB_RECONNECT_MAX_INTERVAL = 60.0  # backoff cap when the controller stays absent
+
+# Names of the signals we handle, precomputed so the shutdown path doesn't
+# build a signal.Signals enum member just to read its name
+_SIG_NAMES = {
+    signal.SIGTERM: "SIGTERM",
+    signal.SIGINT: "SIGINT",
+    signal.SIGHUP: "SIGHUP",
+}
 
 
 class Daemon:
@@ -21,14 +30,26 @@ class Daemon:
 
     def __init__(self, config: Config) -> None:
         self._config = config
-        self._controller = Controller(load_protocol(config.protocol))
+        self._protocol = load_protocol(config.protocol)
+        self._controller = Controller(self._protocol)
         self._speed_ctrl = SpeedController(PROFILES[config.profile])
         self._running = True
+        self._stop_event = threading.Event()
+        # Last speed byte actually sent to the controller; None whenever the
+        # device state is unknown (startup, after reconnection)
+        self._last_speed_byte: int | None = None
+        # Set by _on_reload so the main loop rebinds its config locals
+        self._config_changed = False
+        # Current reconnection delay; doubles up to the cap while the
+        # controller is absent so hardware-less installs don't rescan
+        # /sys via hid.enumerate every 10 seconds forever
+        self._reconnect_backoff = USB_RECONNECT_INTERVAL
 
     def _on_shutdown(self, signum: int, _frame: object) -> None:
-        sig_name = signal.Signals(signum).name
+        sig_name = _SIG_NAMES.get(signum, str(signum))
         log.info("Received %s, shutting down", sig_name)
         self._running = False
+        self._stop_event.set()
 
     def _on_reload(self, _signum: int, _frame: object) -> None:
         log.info("Received SIGHUP, reloading configuration")
@@ -36,6 +57,7 @@ class Daemon:
             config = Config.load([])
             self._config = config
             self._speed_ctrl.curve = PROFILES[config.profile]
+            self._config_changed = True
             log.info("Configuration reloaded: profile=%s", config.profile)
         except (ValueError, KeyError) as e:
             log.error("Failed to reload configuration: %s", e)
@@ -47,7 +69,7 @@ class Daemon:
 
         if not self._controller.find_and_open():
             log.warning(
-                "USB controller not found, retrying in %.0f seconds", USB_RECONNECT_INTERVAL
+                "USB controller not found, retrying in %.0f seconds", self._reconnect_backoff
             )
             return False
 
@@ -58,6 +80,8 @@ class Daemon:
             self._controller.close()
             return False
 
+        self._last_speed_byte = None
+        self._reconnect_backoff = USB_RECONNECT_INTERVAL
         return True
 
     def _safe_shutdown(self) -> None:
@@ -76,10 +100,13 @@ class Daemon:
         self._controller.close()
 
     def _wait(self, seconds: float) -> None:
-        """Sleep in small increments so we can respond to signals promptly."""
-        end = time.monotonic() + seconds
-        while self._running and time.monotonic() < end:
-            time.sleep(min(0.5, end - time.monotonic()))
+        """Sleep until the timeout elapses or shutdown is requested.
+
+        A single Event.wait gives one kernel sleep that is interrupted
+        immediately when a shutdown signal sets the event, instead of waking
+        every 0.5 s to poll a flag.
+        """
+        self._stop_event.wait(seconds)
 
     def run(self) -> None:
         """Main loop: read temperature, compute speed, send to controller."""
@@ -95,30 +122,56 @@ class Daemon:
         signal.signal(signal.SIGINT, self._on_shutdown)
         signal.signal(signal.SIGHUP, self._on_reload)
 
+        # Bind the hot-path lookups to locals; the loop runs for the life of
+        # the process and these only change on SIGHUP reload.
+        controller = self._controller
+        update_speed = self._speed_ctrl.update
+        poll_interval = self._config.poll_interval
+        channels = self._config.channels
+
         while self._running:
+            if self._config_changed:
+                poll_interval = self._config.poll_interval
+                channels = self._config.channels
+                self._config_changed = False
+
             if not self._ensure_connected():
-                self._wait(USB_RECONNECT_INTERVAL)
+                self._wait(self._reconnect_backoff)
+                self._reconnect_backoff = min(
+                    self._reconnect_backoff * 2, USB_RECONNECT_MAX_INTERVAL
+                )
                 continue
 
             temp = read_cpu_temperature()
             if temp is None:
                 log.warning("Could not read CPU temperature")
-                self._wait(self._config.poll_interval)
+                self._wait(poll_interval)
                 continue
 
             log.debug("CPU temperature: %.1f°C", temp)
 
-            new_speed = self._speed_ctrl.update(temp)
+            new_speed = update_speed(temp)
             if new_speed is not None:
-                log.info("Temperature %.1f°C → fan speed %.0f%%", temp, new_speed)
-                try:
-                    self._controller.set_fan_speed(new_speed, self._config.channels)
-                except OSError as e:
-                    log.warning("USB write failed: %s — will attempt reconnection", e)
-                    self._controller.close()
-                    continue
-
-            self._wait(self._config.poll_interval)
+                # The controller quantizes the percentage to a byte; skip the
+                # USB writes entirely when the byte would not change.
+                byte = self._protocol.speed_to_byte(new_speed)
+                if byte == self._last_speed_byte:
+                    log.debug(
+                        "Fan speed %.0f%% maps to current byte value %d, skipping write",
+                        new_speed, byte,
+                    )
+                else:
+                    log.info("Temperature %.1f°C → fan speed %.0f%%", temp, new_speed)
+                    try:
+                        controller.set_fan_speed(new_speed, channels)
+                        self._last_speed_byte = byte
+                    except OSError as e:
+                        log.warning("USB write failed: %s — will attempt reconnection", e)
+                        controller.close()
+                        self._last_speed_byte = None
+                        continue
+
+            self._wait(poll_interval)
 
         self._safe_shutdown()
         log.info("Daemon stopped")
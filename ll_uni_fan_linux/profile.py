@@ -1,9 +1,11 @@
 """Fan speed profiles with linear interpolation and hysteresis."""
 
-from dataclasses import dataclass
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FanCurve:
     """A linear fan curve defined by two temperature/speed anchor points."""
 
@@ -12,16 +14,48 @@ class FanCurve:
     temp_high: float  # Upper temperature threshold (°C)
     speed_high: float # Fan speed at high temp (0-100%)
 
+    # Anchor points as parallel temperature/speed arrays — the canonical
+    # definition of the curve — plus speeds tabulated from them at 0.1 °C
+    # resolution over [temp_low, temp_high], so the per-poll lookup is an
+    # index instead of floating-point interpolation
+    _temps: array = field(init=False, repr=False, compare=False)
+    _speeds: array = field(init=False, repr=False, compare=False)
+    _table: array = field(init=False, repr=False, compare=False)
+    _table_offset: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_temps", array("d", (self.temp_low, self.temp_high)))
+        object.__setattr__(self, "_speeds", array("d", (self.speed_low, self.speed_high)))
+
+        offset = round(self.temp_low * 10)
+        end = round(self.temp_high * 10)
+        object.__setattr__(self, "_table_offset", offset)
+        object.__setattr__(
+            self,
+            "_table",
+            array("d", (self._interpolate(t / 10.0) for t in range(offset, end + 1))),
+        )
+
+    def _interpolate(self, temperature: float) -> float:
+        """Piecewise-linear interpolation over the anchor arrays."""
+        temps, speeds = self._temps, self._speeds
+        if temperature <= temps[0]:
+            return speeds[0]
+        if temperature >= temps[-1]:
+            return speeds[-1]
+        i = bisect_right(temps, temperature)
+        t0, t1 = temps[i - 1], temps[i]
+        s0, s1 = speeds[i - 1], speeds[i]
+        return s0 + (temperature - t0) * (s1 - s0) / (t1 - t0)
+
     def compute_speed(self, temperature: float) -> float:
-        """Compute fan speed for a given temperature using linear interpolation."""
-        if temperature <= self.temp_low:
+        """Compute fan speed for a given temperature (0.1 °C resolution)."""
+        idx = round(temperature * 10) - self._table_offset
+        if idx <= 0:
             return self.speed_low
-        if temperature >= self.temp_high:
+        if idx >= len(self._table) - 1:
             return self.speed_high
-
-        # Linear interpolation
-        ratio = (temperature - self.temp_low) / (self.temp_high - self.temp_low)
-        return self.speed_low + ratio * (self.speed_high - self.speed_low)
+        return self._table[idx]
 
 
 PROFILES: dict[str, FanCurve] = {
@@ -35,6 +69,10 @@ PROFILES: dict[str, FanCurve] = {
 # This prevents rapid oscillations when the temperature hovers around a point.
 HYSTERESIS_DEGREES = 2.0
 
+# The same threshold in integer tenths of a degree, matching the curve's
+# 0.1 °C quantization so the per-poll comparison is integer-only
+_HYSTERESIS_TENTHS = round(HYSTERESIS_DEGREES * 10)
+
 
 class SpeedController:
     """Computes fan speed from temperature with hysteresis.
@@ -47,7 +85,8 @@ class SpeedController:
     def __init__(self, curve: FanCurve) -> None:
         self._curve = curve
         self._last_speed: float | None = None
-        self._reference_temp: float | None = None
+        self._reference_tenths: int | None = None
+        self._last_temp: float | None = None
 
     @property
     def curve(self) -> FanCurve:
@@ -58,7 +97,8 @@ class SpeedController:
         self._curve = value
         # Reset hysteresis state on profile change
         self._last_speed = None
-        self._reference_temp = None
+        self._reference_tenths = None
+        self._last_temp = None
 
     def update(self, temperature: float) -> float | None:
         """Compute the target fan speed for the given temperature.
@@ -66,16 +106,27 @@ class SpeedController:
         Returns the new speed percentage if a change should be applied,
         or None if the current speed should be maintained (hysteresis).
         """
+        # Memo: a sample identical to the previous one can never produce a
+        # new speed — either it was just applied or it was just rejected —
+        # so the idle steady state costs a single comparison.
+        if temperature == self._last_temp:
+            return None
+        self._last_temp = temperature
+
+        # Quantize to tenths once; the hysteresis comparison is then a pure
+        # integer subtract/compare, consistent with the curve's resolution.
+        temp_tenths = round(temperature * 10)
+        ref = self._reference_tenths
+
         # Always apply on first call
-        if self._last_speed is None or self._reference_temp is None:
+        if self._last_speed is None or ref is None:
             speed = self._curve.compute_speed(temperature)
             self._last_speed = speed
-            self._reference_temp = temperature
+            self._reference_tenths = temp_tenths
             return speed
 
         # Check hysteresis: has temp moved enough from the reference point?
-        delta = abs(temperature - self._reference_temp)
-        if delta < HYSTERESIS_DEGREES:
+        if abs(temp_tenths - ref) < _HYSTERESIS_TENTHS:
             return None
 
         new_speed = self._curve.compute_speed(temperature)
@@ -85,5 +136,5 @@ class SpeedController:
             return None
 
         self._last_speed = new_speed
-        self._reference_temp = temperature
+        self._reference_tenths = temp_tenths
         return new_speed
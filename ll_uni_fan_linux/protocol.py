@@ -7,7 +7,8 @@ the active protocol is selected by name via the PROTOCOL config parameter.
 Lian-Li protocol reverse-engineered from https://github.com/EightB1ts/uni-sync.
 """
 
-from dataclasses import dataclass
+import functools
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 
 import yaml
@@ -16,8 +17,14 @@ _PROTOCOLS_FILE = Path(__file__).parent / "protocols.yaml"
 
 DEFAULT_PROTOCOL_KEY = "lian-li-sl-inf"
 
+# All supported controllers expose four fan channels
+MAX_CHANNELS = 4
 
-@dataclass(frozen=True)
+# Per-channel mode selection bits (0x10 << channel), precomputed
+_MODE_BITS = (0x10, 0x20, 0x40, 0x80)
+
+
+@dataclass(frozen=True, slots=True)
 class Protocol:
     """USB HID protocol definition for a fan controller model."""
 
@@ -42,40 +49,146 @@ class Protocol:
     delay_mode: float
     delay_speed: float
 
-    def speed_to_byte(self, speed_percent: float) -> int:
-        """Convert a speed percentage (0-100) to the controller byte value."""
+    # Command frames precomputed once per protocol; the command bytes are fixed
+    # at load time, so the hot write path should not rebuild them per call.
+    _init_frame: bytes = field(init=False, repr=False, compare=False)
+    _mode_frames: tuple[bytes, ...] = field(init=False, repr=False, compare=False)
+    _speed_frames: tuple[bytearray, ...] = field(init=False, repr=False, compare=False)
+    _speed_lut: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Shared control-command prefix; the prefix bytes come from the
+        # protocol definition, so they are built here rather than as module
+        # constants. object.__setattr__ because the dataclass is frozen.
+        prefix = bytes((self.cmd_prefix, self.sub_cmd))
+        object.__setattr__(
+            self,
+            "_init_frame",
+            prefix + bytes((self.init_byte, 0x00, 0x00, 0x00, 0x00)),
+        )
+        object.__setattr__(
+            self,
+            "_mode_frames",
+            tuple(
+                prefix + bytes((self.mode_byte, bit)) for bit in _MODE_BITS[:MAX_CHANNELS]
+            ),
+        )
+        object.__setattr__(
+            self,
+            "_speed_frames",
+            tuple(
+                bytearray((self.cmd_prefix, self.speed_channel_base + ch, 0x00, 0x00))
+                for ch in range(MAX_CHANNELS)
+            ),
+        )
+        object.__setattr__(
+            self,
+            "_speed_lut",
+            bytes(self._speed_to_byte_raw(pct) for pct in range(101)),
+        )
+
+    def _speed_to_byte_raw(self, speed_percent: float) -> int:
+        """Arithmetic percentage-to-byte conversion, used to build the table."""
         clamped = max(0.0, min(100.0, speed_percent))
         return int((self.rpm_min + self.rpm_scale * clamped) / self.rpm_divisor)
 
-    def build_init(self) -> list[int]:
-        """Build the initialization command (no RGB sync)."""
-        return [self.cmd_prefix, self.sub_cmd, self.init_byte, 0x00, 0x00, 0x00, 0x00]
+    def speed_to_byte(self, speed_percent: float) -> int:
+        """Convert a speed percentage (0-100) to the controller byte value.
+
+        Indexes a 101-entry table precomputed at load time; the percentage is
+        quantized to an integer, which matches the controller's resolution.
+        """
+        return self._speed_lut[min(100, max(0, int(speed_percent)))]
+
+    def build_init(self) -> bytes:
+        """Return the initialization command (no RGB sync)."""
+        return self._init_frame
+
+    def build_mode(self, channel: int) -> bytes:
+        """Return the manual mode command for a channel."""
+        return self._mode_frames[channel]
+
+    def build_speed(self, channel: int, speed_percent: float) -> bytearray:
+        """Return the speed command for a channel.
+
+        The returned buffer is a cached per-channel template with only the
+        speed byte patched; callers must not hold on to it across calls.
+        """
+        return self.build_speed_byte(channel, self.speed_to_byte(speed_percent))
+
+    def build_speed_byte(self, channel: int, byte: int) -> bytearray:
+        """Return the speed command for a channel from a precomputed byte value.
+
+        Lets callers convert the percentage once and reuse the byte across
+        channels, since the value is identical for all of them.
+        """
+        frame = self._speed_frames[channel]
+        frame[3] = byte
+        return frame
 
-    def build_mode(self, channel: int) -> list[int]:
-        """Build the manual mode command for a channel."""
-        return [self.cmd_prefix, self.sub_cmd, self.mode_byte, 0x10 << channel]
 
-    def build_speed(self, channel: int, speed_percent: float) -> list[int]:
-        """Build the speed command for a channel."""
-        return [self.cmd_prefix, self.speed_channel_base + channel, 0x00,
-                self.speed_to_byte(speed_percent)]
+# Expected entry fields and their types, derived from the dataclass so the
+# schema can't drift from the Protocol definition
+_PROTOCOL_FIELDS: dict[str, type] = {f.name: f.type for f in fields(Protocol) if f.init}
 
 
+def _validate_protocols(data: object) -> dict[str, dict]:
+    """Validate the structure of parsed protocol definitions.
+
+    Runs once per process (behind the _load_all cache) so a malformed entry
+    fails with a clear message at load time instead of a TypeError deep in
+    the daemon, and Protocol construction can trust the data afterwards.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("protocols.yaml must map protocol keys to definitions")
+
+    for key, entry in data.items():
+        if not isinstance(entry, dict):
+            raise ValueError(f"Protocol '{key}' must be a mapping")
+
+        if missing := _PROTOCOL_FIELDS.keys() - entry.keys():
+            raise ValueError(f"Protocol '{key}' is missing fields: {', '.join(sorted(missing))}")
+        if unknown := entry.keys() - _PROTOCOL_FIELDS.keys():
+            raise ValueError(f"Protocol '{key}' has unknown fields: {', '.join(sorted(unknown))}")
+
+        for name, expected in _PROTOCOL_FIELDS.items():
+            value = entry[name]
+            # YAML may give an int where a float is declared; bool is an int
+            # subclass and never valid here
+            ok = isinstance(value, (int, float) if expected is float else expected)
+            if not ok or isinstance(value, bool):
+                raise ValueError(
+                    f"Protocol '{key}' field '{name}' must be {expected.__name__}, "
+                    f"got {type(value).__name__}"
+                )
+
+    return data
+
+
+@functools.lru_cache(maxsize=1)
 def _load_all() -> dict[str, dict]:
-    """Load raw protocol definitions from YAML."""
+    """Load and validate raw protocol definitions from YAML.
+
+    The parsed result is cached for the lifetime of the process: the file is
+    bundled with the package and does not change at runtime, and both config
+    validation and protocol loading would otherwise re-read it.
+    """
     with open(_PROTOCOLS_FILE) as f:
-        return yaml.safe_load(f)
+        return _validate_protocols(yaml.safe_load(f))
 
 
-def available_protocols() -> list[str]:
-    """Return the list of available protocol keys."""
-    return list(_load_all().keys())
+def available_protocols() -> tuple[str, ...]:
+    """Return the available protocol keys."""
+    return tuple(_load_all().keys())
 
 
+@functools.lru_cache(maxsize=None)
 def load_protocol(key: str) -> Protocol:
     """Load a Protocol instance by key from protocols.yaml.
 
-    Raises KeyError if the key is not found.
+    Cached per key so repeated loads share one Protocol object and its
+    precomputed frames and speed table. Raises KeyError if the key is not
+    found (failed lookups are not cached).
     """
     protocols = _load_all()
     if key not in protocols:
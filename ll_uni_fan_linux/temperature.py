@@ -1,16 +1,38 @@
 """CPU temperature reading via psutil."""
 
 import logging
+import time
 
 import psutil
 
 log = logging.getLogger(__name__)
 
-# Preferred sensor labels in priority order
+# Preferred sensor labels in priority order, plus a rank map for O(1)
+# membership and priority tests while scanning entries
 _PREFERRED_LABELS = ("Package id 0", "Tctl", "Tdie", "CPU")
+_PREFERRED_RANK = {label: rank for rank, label in enumerate(_PREFERRED_LABELS)}
 
 # Known CPU thermal driver names
-_CPU_DRIVERS = ("coretemp", "k10temp", "zenpower")
+_CPU_DRIVERS = frozenset(("coretemp", "k10temp", "zenpower"))
+
+# The sensor that won the last full scan, as (driver, index, label). The
+# winning sensor essentially never changes while the daemon runs, so
+# subsequent polls index it directly instead of re-running the priority
+# logic. Re-validated every _SENSOR_CACHE_TTL seconds so hot-plugged
+# sensors are eventually rediscovered.
+_SENSOR_CACHE_TTL = 60.0
+
+_cached_sensor: tuple[str, int, str] | None = None
+_cached_sensor_expiry = 0.0
+
+# Successful readings are reused for a short window: sensors_temperatures()
+# walks sysfs with several syscalls per sensor, and the kernel refreshes the
+# values far less often than a fast poller may ask for them. Failures are
+# never cached.
+_READ_TTL = 0.25
+
+_last_read: float | None = None
+_last_read_ts = 0.0
 
 
 def read_cpu_temperature() -> float | None:
@@ -19,6 +41,23 @@ def read_cpu_temperature() -> float | None:
     Returns the package/die temperature if available, otherwise the max core temperature.
     Returns None if no temperature source is available.
     """
+    global _last_read, _last_read_ts
+
+    now = time.monotonic()
+    if _last_read is not None and now - _last_read_ts < _READ_TTL:
+        return _last_read
+
+    temp = _read_cpu_temperature(now)
+    if temp is not None:
+        _last_read = temp
+        _last_read_ts = now
+    return temp
+
+
+def _read_cpu_temperature(now: float) -> float | None:
+    """Read the temperature from psutil, bypassing the TTL cache."""
+    global _cached_sensor, _cached_sensor_expiry
+
     try:
         temps = psutil.sensors_temperatures()
     except (AttributeError, OSError) as e:
@@ -28,22 +67,48 @@ def read_cpu_temperature() -> float | None:
     if not temps:
         return None
 
-    # Look for preferred labels across all sensor groups
-    for label in _PREFERRED_LABELS:
-        for entries in temps.values():
-            for entry in entries:
+    # Fast path: reuse the sensor selected by the last full scan.
+    if _cached_sensor is not None:
+        if now < _cached_sensor_expiry:
+            driver, idx, label = _cached_sensor
+            entries = temps.get(driver)
+            if entries is not None and idx < len(entries):
+                entry = entries[idx]
                 if entry.label == label and entry.current > 0:
                     return entry.current
+        _cached_sensor = None
+
+    # Single pass over every entry, tracking the best preferred label (by
+    # priority rank), the hottest reading from known CPU drivers, and the
+    # hottest reading overall.
+    best_rank = len(_PREFERRED_LABELS)
+    best_preferred: tuple[float, str, int] | None = None
+    best_cpu_driver: float | None = None
+    best_any: float | None = None
+
+    for driver, entries in temps.items():
+        is_cpu_driver = driver in _CPU_DRIVERS
+        for idx, e in enumerate(entries):
+            current = e.current
+            if current <= 0:
+                continue
+            rank = _PREFERRED_RANK.get(e.label)
+            if rank is not None and rank < best_rank:
+                best_rank = rank
+                best_preferred = (current, driver, idx)
+            if is_cpu_driver and (best_cpu_driver is None or current > best_cpu_driver):
+                best_cpu_driver = current
+            if best_any is None or current > best_any:
+                best_any = current
+
+    if best_preferred is not None:
+        current, driver, idx = best_preferred
+        _cached_sensor = (driver, idx, _PREFERRED_LABELS[best_rank])
+        _cached_sensor_expiry = now + _SENSOR_CACHE_TTL
+        return current
 
-    # Fallback: highest reading from known CPU thermal drivers
-    for name in _CPU_DRIVERS:
-        if name in temps:
-            readings = [e.current for e in temps[name] if e.current > 0]
-            if readings:
-                return max(readings)
-
-    # Last resort: max across all sensors
-    all_readings = [
-        e.current for entries in temps.values() for e in entries if e.current > 0
-    ]
-    return max(all_readings) if all_readings else None
+    # Fallback: highest reading from known CPU thermal drivers,
+    # then max across all sensors
+    if best_cpu_driver is not None:
+        return best_cpu_driver
+    return best_any
@@ -42,6 +42,10 @@ class TestConfigValidation:
         with pytest.raises(ValueError, match="Unknown protocol"):
             Config(protocol="nonexistent")
 
+    def test_invalid_log_level_raises(self) -> None:
+        with pytest.raises(ValueError, match="Invalid log level"):
+            Config(log_level="VERBOSE")
+
 
 class TestParseChannels:
     def test_single_channel(self) -> None:
@@ -135,10 +139,10 @@ class TestConfigLoadEnvFile:
         monkeypatch.setattr(config_mod, "DEFAULT_CONFIG_PATH", str(env_file))
         monkeypatch.setenv("LOG_LEVEL", "")
 
-        cfg = Config.load([])
-        # Empty string from env var → .upper() → "" → invalid for logging,
-        # but it should NOT fall through to file value "WARNING"
-        assert cfg.log_level == ""
+        # Empty string from env var does NOT fall through to file value
+        # "WARNING" — it reaches validation as-is and is rejected there.
+        with pytest.raises(ValueError, match="Invalid log level ''"):
+            Config.load([])
 
     def test_cli_overrides_env_var(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setenv("PROFILE", "silent")
@@ -1,4 +1,4 @@
-"""Tests for the generic USB HID controller with mocked device."""
+"""Tests for the generic USB HID controller with a fake device."""
 
 from unittest.mock import MagicMock, patch
 
@@ -10,30 +10,47 @@ from ll_uni_fan_linux.protocol import load_protocol
 PROTO = load_protocol("lian-li-sl-inf")
 
 
-def _make_connected_controller() -> tuple[Controller, MagicMock]:
-    """Create a Controller with a mocked HID device, already initialized."""
-    mock_dev = MagicMock()
+class FakeHID:
+    """Minimal stand-in for hid.device: plain attributes, no mock dispatch.
+
+    Snapshots each written buffer with bytes() at call time, which also
+    guards against the controller reusing a mutable frame between writes.
+    """
+
+    def __init__(self) -> None:
+        self.writes: list[bytes] = []
+        self.closed = False
+
+    def write(self, data: bytes | bytearray) -> None:
+        self.writes.append(bytes(data))
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _make_connected_controller() -> tuple[Controller, FakeHID]:
+    """Create a Controller with a fake HID device, already initialized."""
+    fake = FakeHID()
     ctrl = Controller(PROTO)
-    ctrl._device = mock_dev
+    ctrl._device = fake
     ctrl._initialized = True
-    return ctrl, mock_dev
+    return ctrl, fake
 
 
 class TestControllerInitialize:
     @patch("ll_uni_fan_linux.controller.time.sleep")
     def test_initialize_sends_init_and_mode(self, mock_sleep: MagicMock) -> None:
-        mock_dev = MagicMock()
+        fake = FakeHID()
         ctrl = Controller(PROTO)
-        ctrl._device = mock_dev
+        ctrl._device = fake
 
         ctrl.initialize((0, 1, 2))
-        writes = [c.args[0] for c in mock_dev.write.call_args_list]
 
-        assert writes[0] == bytes(PROTO.build_init())
-        assert writes[1] == bytes(PROTO.build_mode(0))
-        assert writes[2] == bytes(PROTO.build_mode(1))
-        assert writes[3] == bytes(PROTO.build_mode(2))
-        assert mock_dev.write.call_count == 4
+        assert fake.writes[0] == bytes(PROTO.build_init())
+        assert fake.writes[1] == bytes(PROTO.build_mode(0))
+        assert fake.writes[2] == bytes(PROTO.build_mode(1))
+        assert fake.writes[3] == bytes(PROTO.build_mode(2))
+        assert len(fake.writes) == 4
         assert ctrl._initialized is True
 
     def test_initialize_not_connected_raises(self) -> None:
@@ -45,15 +62,14 @@ class TestControllerInitialize:
 class TestControllerSetFanSpeed:
     @patch("ll_uni_fan_linux.controller.time.sleep")
     def test_speed_commands_only(self, mock_sleep: MagicMock) -> None:
-        ctrl, mock_dev = _make_connected_controller()
+        ctrl, fake = _make_connected_controller()
         channels = (0, 1, 2)
         ctrl.set_fan_speed(50.0, channels)
 
-        writes = [c.args[0] for c in mock_dev.write.call_args_list]
         for i, ch in enumerate(channels):
-            assert writes[i] == bytes(PROTO.build_speed(ch, 50.0))
+            assert fake.writes[i] == bytes(PROTO.build_speed(ch, 50.0))
 
-        assert mock_dev.write.call_count == len(channels)
+        assert len(fake.writes) == len(channels)
 
     def test_not_connected_raises(self) -> None:
         ctrl = Controller(PROTO)
@@ -62,7 +78,7 @@ class TestControllerSetFanSpeed:
 
     def test_not_initialized_raises(self) -> None:
         ctrl = Controller(PROTO)
-        ctrl._device = MagicMock()
+        ctrl._device = FakeHID()
         ctrl._initialized = False
         with pytest.raises(OSError, match="not initialized"):
             ctrl.set_fan_speed(50.0, (0,))
@@ -90,17 +106,22 @@ class TestControllerConnection:
         mock_hid.enumerate.assert_called_once_with(PROTO.vendor_id, PROTO.product_id)
 
     def test_close_resets_state(self) -> None:
-        ctrl, mock_dev = _make_connected_controller()
+        ctrl, fake = _make_connected_controller()
         ctrl._device_path = b"/dev/hidraw0"
 
         ctrl.close()
         assert ctrl.connected is False
         assert ctrl._initialized is False
-        mock_dev.close.assert_called_once()
+        assert fake.closed is True
 
     def test_close_tolerates_os_error(self) -> None:
-        ctrl, mock_dev = _make_connected_controller()
-        mock_dev.close.side_effect = OSError("USB gone")
+        class BrokenCloseHID(FakeHID):
+            def close(self) -> None:
+                raise OSError("USB gone")
+
+        ctrl = Controller(PROTO)
+        ctrl._device = BrokenCloseHID()
+        ctrl._initialized = True
 
         ctrl.close()  # should not raise
         assert ctrl.connected is False
@@ -47,6 +47,12 @@ class TestSpeedController:
         sc = SpeedController(BALANCED)
         assert sc.update(60.0) == pytest.approx(65.0)
 
+    def test_repeated_sample_returns_none(self) -> None:
+        sc = SpeedController(BALANCED)
+        assert sc.update(60.0) is not None
+        assert sc.update(60.0) is None
+        assert sc.update(60.0) is None
+
     def test_within_hysteresis_returns_none(self) -> None:
         sc = SpeedController(BALANCED)
         sc.update(60.0)
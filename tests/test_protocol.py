@@ -2,6 +2,7 @@
 
 import pytest
 
+import ll_uni_fan_linux.protocol as protocol
 from ll_uni_fan_linux.protocol import available_protocols, load_protocol
 
 
@@ -33,6 +34,29 @@ class TestLoadProtocol:
         assert "lian-li-al-v1" in keys
 
 
+class TestValidateProtocols:
+    def test_bundled_file_is_valid(self) -> None:
+        assert protocol._validate_protocols(protocol._load_all()) is not None
+
+    def test_missing_field_rejected(self) -> None:
+        with pytest.raises(ValueError, match="missing fields"):
+            protocol._validate_protocols({"broken": {"name": "X"}})
+
+    def test_unknown_field_rejected(self) -> None:
+        entry = dict(protocol._load_all()["lian-li-sl-inf"], rgb_mode=1)
+        with pytest.raises(ValueError, match="unknown fields"):
+            protocol._validate_protocols({"broken": entry})
+
+    def test_wrong_type_rejected(self) -> None:
+        entry = dict(protocol._load_all()["lian-li-sl-inf"], vendor_id="0x0CF2")
+        with pytest.raises(ValueError, match="must be int"):
+            protocol._validate_protocols({"broken": entry})
+
+    def test_non_mapping_entry_rejected(self) -> None:
+        with pytest.raises(ValueError, match="must be a mapping"):
+            protocol._validate_protocols({"broken": ["not", "a", "mapping"]})
+
+
 class TestSpeedToByte:
     @pytest.mark.parametrize("pct, expected", [
         (0, 9),
@@ -67,25 +91,32 @@ class TestSpeedToByte:
 class TestBuildCommands:
     def test_build_init(self) -> None:
         proto = load_protocol("lian-li-sl-inf")
-        assert proto.build_init() == [0xE0, 0x10, 0x61, 0, 0, 0, 0]
+        assert proto.build_init() == bytes([0xE0, 0x10, 0x61, 0, 0, 0, 0])
 
     def test_build_mode_channel_0(self) -> None:
         proto = load_protocol("lian-li-sl-inf")
-        assert proto.build_mode(0) == [0xE0, 0x10, 0x62, 0x10]
+        assert proto.build_mode(0) == bytes([0xE0, 0x10, 0x62, 0x10])
 
     def test_build_mode_channel_2(self) -> None:
         proto = load_protocol("lian-li-sl-inf")
-        assert proto.build_mode(2) == [0xE0, 0x10, 0x62, 0x40]
+        assert proto.build_mode(2) == bytes([0xE0, 0x10, 0x62, 0x40])
 
     def test_build_speed(self) -> None:
         proto = load_protocol("lian-li-sl-inf")
         cmd = proto.build_speed(1, 50.0)
-        assert cmd == [0xE0, 0x21, 0x00, 54]
+        assert cmd == bytes([0xE0, 0x21, 0x00, 54])
+
+    def test_build_speed_reuses_channel_buffer(self) -> None:
+        proto = load_protocol("lian-li-sl-inf")
+        first = proto.build_speed(0, 0.0)
+        second = proto.build_speed(0, 100.0)
+        assert second is first
+        assert second == bytes([0xE0, 0x20, 0x00, 100])
 
     def test_al_v1_uses_different_init_byte(self) -> None:
         proto = load_protocol("lian-li-al-v1")
-        assert proto.build_init() == [0xE0, 0x10, 0x41, 0, 0, 0, 0]
+        assert proto.build_init() == bytes([0xE0, 0x10, 0x41, 0, 0, 0, 0])
 
     def test_sl_v1_uses_different_mode_byte(self) -> None:
         proto = load_protocol("lian-li-sl-v1")
-        assert proto.build_mode(0) == [0xE0, 0x10, 0x31, 0x10]
+        assert proto.build_mode(0) == bytes([0xE0, 0x10, 0x31, 0x10])
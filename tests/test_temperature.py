@@ -3,12 +3,23 @@
 from collections import namedtuple
 from unittest.mock import patch
 
+import pytest
+
+import ll_uni_fan_linux.temperature as temperature
 from ll_uni_fan_linux.temperature import read_cpu_temperature
 
 # psutil uses namedtuples for sensor entries
 SensorEntry = namedtuple("shwtemp", ["label", "current", "high", "critical"])
 
 
+@pytest.fixture(autouse=True)
+def _reset_sensor_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Clear cached state and disable the read TTL so tests stay independent."""
+    monkeypatch.setattr(temperature, "_cached_sensor", None)
+    monkeypatch.setattr(temperature, "_last_read", None)
+    monkeypatch.setattr(temperature, "_READ_TTL", 0.0)
+
+
 class TestReadCpuTemperature:
     @patch("ll_uni_fan_linux.temperature.psutil")
     def test_preferred_label_package(self, mock_psutil: object) -> None:
@@ -47,6 +58,45 @@ class TestReadCpuTemperature:
         mock_psutil.sensors_temperatures.side_effect = OSError("no sensors")  # type: ignore[attr-defined]
         assert read_cpu_temperature() is None
 
+    @patch("ll_uni_fan_linux.temperature.psutil")
+    def test_cached_sensor_reused_across_polls(self, mock_psutil: object) -> None:
+        mock_psutil.sensors_temperatures.return_value = {  # type: ignore[attr-defined]
+            "coretemp": [SensorEntry("Package id 0", 58.0, 100.0, 100.0)]
+        }
+        assert read_cpu_temperature() == 58.0
+        assert temperature._cached_sensor == ("coretemp", 0, "Package id 0")
+
+        mock_psutil.sensors_temperatures.return_value = {  # type: ignore[attr-defined]
+            "coretemp": [SensorEntry("Package id 0", 61.0, 100.0, 100.0)]
+        }
+        assert read_cpu_temperature() == 61.0
+
+    @patch("ll_uni_fan_linux.temperature.psutil")
+    def test_cached_sensor_invalidated_when_shape_changes(self, mock_psutil: object) -> None:
+        mock_psutil.sensors_temperatures.return_value = {  # type: ignore[attr-defined]
+            "coretemp": [SensorEntry("Package id 0", 58.0, 100.0, 100.0)]
+        }
+        assert read_cpu_temperature() == 58.0
+
+        mock_psutil.sensors_temperatures.return_value = {  # type: ignore[attr-defined]
+            "k10temp": [SensorEntry("Tctl", 62.0, 95.0, 95.0)]
+        }
+        assert read_cpu_temperature() == 62.0
+        assert temperature._cached_sensor == ("k10temp", 0, "Tctl")
+
+    @patch("ll_uni_fan_linux.temperature.psutil")
+    def test_reading_reused_within_ttl(
+        self, mock_psutil: object, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(temperature, "_READ_TTL", 60.0)
+        mock_psutil.sensors_temperatures.return_value = {  # type: ignore[attr-defined]
+            "k10temp": [SensorEntry("Tctl", 62.0, 95.0, 95.0)]
+        }
+        assert read_cpu_temperature() == 62.0
+        # Second call within the TTL must not hit psutil again
+        assert read_cpu_temperature() == 62.0
+        assert mock_psutil.sensors_temperatures.call_count == 1  # type: ignore[attr-defined]
+
     @patch("ll_uni_fan_linux.temperature.psutil")
     def test_last_resort_max_across_all(self, mock_psutil: object) -> None:
         mock_psutil.sensors_temperatures.return_value = {  # type: ignore[attr-defined]